@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+from collections.abc import Callable
 from enum import Enum, auto
 
 from htmlnode import HTMLNode
@@ -10,6 +13,32 @@ from parentnode import ParentNode
 from parsing import text_to_textnodes
 from textnode import TextNode, TextType, text_node_to_html_node
 
+_HEADING_TAGS = tuple(sys.intern(f"h{level}") for level in range(1, 7))
+_OL_PREFIXES = tuple(f"{number}. " for number in range(1, 1000))
+# lenient patterns the public converters fall back to for blocks of another type
+_HEADING_RE = re.compile(r"(?P<level>#{1,6})\s+(?P<text>.*)$", re.DOTALL | re.MULTILINE)
+_QUOTE_LINE_RE = re.compile(r"^>(.*)$", re.MULTILINE)
+_UL_ITEM_RE = re.compile(r"^-\s(.*)$", re.MULTILINE)
+_OL_ITEM_RE = re.compile(r"^\d+\.\s(.*)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _inline_textnodes(text: str) -> tuple[TextNode, ...]:
+    """Parses inline markdown, sharing one parse between repeated snippets.
+
+    Every block with the same text gets the same TextNode instances, so
+    callers must only read the returned nodes and never change their fields;
+    the converters below only hand them to text_node_to_html_node. The
+    nodes are returned as a tuple so the sequence cannot be changed either.
+
+    Args:
+        text: The inline markdown text to parse.
+
+    Returns:
+        The TextNodes of the parsed text.
+    """
+    return tuple(text_to_textnodes(text))
+
 
 class BlockType(Enum):
     """Enumeration of different types of Markdown blocks.
@@ -41,7 +70,8 @@ def markdown_to_blocks(markdown: str) -> list[str]:
     This function takes a Markdown string as input and splits it into a list
     of blocks based on double newline characters ("\n\n"). It also removes
     leading and trailing whitespace from each block and filters out any empty
-    blocks.
+    blocks. Lines holding only whitespace do not separate blocks, so indented
+    blank lines inside a code block keep the block together.
 
     Args:
         markdown: The Markdown string to split into blocks.
@@ -50,12 +80,70 @@ def markdown_to_blocks(markdown: str) -> list[str]:
         A list of strings, where each string is a block of Markdown text.
         Empty blocks are filtered out.
     """
-    blocks = list(filter(lambda x: x != "", (map(str.strip, markdown.split("\n\n")))))
-    # blocks = markdown.split("\n\n")
-    # blocks = map(str.strip, block)
-    # blocks = filter(lambda x: x != "", blocks)
-    # blocks = list(blocks)
-    return blocks
+    stripped = markdown.strip()
+    if "\n\n" not in stripped:
+        return [stripped] if stripped else []
+    return [block for block in (chunk.strip() for chunk in stripped.split("\n\n")) if block]
+
+
+BlockParts = tuple[int, str] | list[str] | None
+
+
+def split_heading(block: str) -> tuple[int, str] | None:
+    """Splits a heading block into its level and text.
+
+    Args:
+        block: The Markdown block string to split.
+
+    Returns:
+        A tuple of the heading level and the heading text, or None if the
+        block is not a heading.
+    """
+    level = len(block) - len(block.lstrip("#"))
+    if 1 <= level <= 6 and block[level : level + 1].isspace():
+        return level, block[level:].lstrip()
+    return None
+
+
+def classify_block(block: str) -> tuple[BlockType, BlockParts]:
+    """Determines the BlockType of a Markdown block and extracts its parts.
+
+    The parts found while classifying the block are returned alongside its
+    type so converters do not have to parse the block a second time. The
+    first character of the block selects which check to run.
+
+    Args:
+        block: The Markdown block string to analyze.
+
+    Returns:
+        A tuple of the BlockType and the parsed parts of the block: the
+        level and text for a heading, the item text of each line for a
+        quote or list, and None for code blocks and paragraphs.
+    """
+    first = block[:1]
+    if first == "#":
+        heading = split_heading(block)
+        if heading is not None:
+            return BlockType.HEADING, heading
+        return BlockType.PARAGRAPH, None
+    if first == "`" and block.startswith("```") and block.endswith("```"):
+        return BlockType.CODE, None
+    # every line carries the prefix iff each newline is followed by it
+    if first == ">" and block.count("\n>") == block.count("\n"):
+        return BlockType.QUOTE, [line[1:].strip() for line in block.split("\n")]
+    if first == "-" and block.startswith("- ") and block.count("\n- ") == block.count("\n"):
+        return BlockType.UNORDERED_LIST, [line[2:] for line in block.split("\n")]
+    if first.isdigit():
+        items = []
+        for i, line in enumerate(block.split("\n")):
+            prefix = _OL_PREFIXES[i] if i < len(_OL_PREFIXES) else f"{i + 1}. "
+            if not line.startswith(prefix):
+                break
+            items.append(line[len(prefix) :])
+        else:
+            return BlockType.ORDERED_LIST, items
+
+    return BlockType.PARAGRAPH, None
 
 
 def block_to_block_type(block: str) -> BlockType:
@@ -72,24 +160,7 @@ def block_to_block_type(block: str) -> BlockType:
     Returns:
         The BlockType of the given block.
     """
-    if re.match(
-        r"(?P<level>#{1,6})\s+(?P<text>.*)$", block, re.DOTALL | re.MULTILINE
-    ):  # extra information in case I need it later.
-        return BlockType.HEADING
-    if block.startswith("```") and block.endswith("```"):
-        return BlockType.CODE
-    lines = block.split("\n")
-    if all(line.startswith(">") for line in lines):
-        return BlockType.QUOTE
-    if all(line.startswith("- ") for line in lines):
-        return BlockType.UNORDERED_LIST
-    for i, line in enumerate(lines, start=1):
-        if not line.startswith(f"{i}. "):
-            break
-    else:
-        return BlockType.ORDERED_LIST
-
-    return BlockType.PARAGRAPH
+    return classify_block(block)[0]
 
 
 def markdown_to_html_node(markdown: str) -> ParentNode:
@@ -97,36 +168,19 @@ def markdown_to_html_node(markdown: str) -> ParentNode:
 
     This function takes a markdown string, splits it into blocks,
     determines the type of each block, and converts each block
-    into a ParentNode.
+    into a ParentNode using the converter registered for its type. The
+    parts extracted during classification are handed to the converter.
 
     Args:
         markdown: The markdown string to convert.
 
     Returns:
         A ParentNode representing the parsed markdown.
-
-    Raises:
-        ValueError: If the block type is invalid.
     """
     children: list[HTMLNode] = []
-    blocks = markdown_to_blocks(markdown)
-    for block in blocks:
-        block_type = block_to_block_type(block)
-        match block_type:
-            case BlockType.HEADING:
-                children.append(block_to_heading(block))
-            case BlockType.CODE:
-                children.append(block_to_code(block))
-            case BlockType.QUOTE:
-                children.append(block_to_quote(block))
-            case BlockType.UNORDERED_LIST:
-                children.append(block_to_ul(block))
-            case BlockType.ORDERED_LIST:
-                children.append(block_to_ol(block))
-            case BlockType.PARAGRAPH:
-                children.append(block_to_paragraph(block))
-            case _:
-                raise ValueError("invalid block type")
+    for block in markdown_to_blocks(markdown):
+        block_type, parts = classify_block(block)
+        children.append(_BLOCK_DISPATCH[block_type](block, parts))
 
     return ParentNode("div", children)
 
@@ -143,11 +197,30 @@ def block_to_heading(block: str) -> ParentNode:
     Returns:
         A ParentNode representing the heading.
     """
-    match = re.match(r"(?P<level>#{1,6})\s+(?P<text>.*)$", block, re.DOTALL | re.MULTILINE)
+    return _heading_node(block, _parts_if(block, BlockType.HEADING))
+
+
+def _heading_node(block: str, parts: BlockParts) -> ParentNode:
+    """Builds a heading from the parts of a heading block, or leniently from the block."""
+    if isinstance(parts, tuple):
+        return heading_from_parts(*parts)
+    match = _HEADING_RE.match(block)
     if match is None:
-        return ParentNode("h1", list(map(text_node_to_html_node, text_to_textnodes(""))))
-    text_nodes = text_to_textnodes(match.group("text"))
-    return ParentNode(f"h{len(match.group('level'))}", list(map(text_node_to_html_node, text_nodes)))
+        return heading_from_parts(1, "")
+    return heading_from_parts(len(match.group("level")), match.group("text"))
+
+
+def heading_from_parts(level: int, text: str) -> ParentNode:
+    """Builds a heading ParentNode from its level and text.
+
+    Args:
+        level: The heading level, from 1 to 6.
+        text: The inline markdown text of the heading.
+
+    Returns:
+        A ParentNode representing the heading.
+    """
+    return ParentNode(_HEADING_TAGS[level - 1], list(map(text_node_to_html_node, _inline_textnodes(text))))
 
 
 def block_to_code(block: str) -> ParentNode:
@@ -180,9 +253,26 @@ def block_to_quote(block: str) -> ParentNode:
     Returns:
         A ParentNode representing the quote block.
     """
-    match = re.findall(r"^>(.*)$", block, flags=re.MULTILINE)
-    text = " ".join(line.strip() for line in match)
-    text_nodes = text_to_textnodes(text)
+    return _quote_node(block, _parts_if(block, BlockType.QUOTE))
+
+
+def _quote_node(block: str, parts: BlockParts) -> ParentNode:
+    """Builds a blockquote from the lines of a quote block, or from any '>' lines of the block."""
+    if isinstance(parts, list):
+        return quote_from_lines(parts)
+    return quote_from_lines([line.strip() for line in _QUOTE_LINE_RE.findall(block)])
+
+
+def quote_from_lines(lines: list[str]) -> ParentNode:
+    """Builds a blockquote ParentNode from the quoted lines.
+
+    Args:
+        lines: The text of each quoted line with the leading '>' removed.
+
+    Returns:
+        A ParentNode representing the quote block.
+    """
+    text_nodes = _inline_textnodes(" ".join(lines))
     return ParentNode("blockquote", list(map(text_node_to_html_node, text_nodes)))
 
 
@@ -198,11 +288,12 @@ def block_to_ul(block: str) -> ParentNode:
     Returns:
         A ParentNode representing the unordered list.
     """
-    match = re.findall(r"^-\s(.*)$", block, flags=re.MULTILINE)
-    list_nodes: list[HTMLNode] = []
-    for item in match:
-        list_nodes.append(ParentNode("li", list(map(text_node_to_html_node, text_to_textnodes(item)))))
-    return ParentNode("ul", list_nodes)
+    return _ul_node(block, _parts_if(block, BlockType.UNORDERED_LIST))
+
+
+def _ul_node(block: str, parts: BlockParts) -> ParentNode:
+    """Builds a <ul> from the items of a list block, or from any '- ' lines of the block."""
+    return list_from_items("ul", parts if isinstance(parts, list) else _UL_ITEM_RE.findall(block))
 
 
 def block_to_ol(block: str) -> ParentNode:
@@ -217,11 +308,28 @@ def block_to_ol(block: str) -> ParentNode:
     Returns:
         A ParentNode representing the ordered list.
     """
-    match = re.findall(r"^\d+\.\s(.*)$", block, flags=re.MULTILINE)
+    return _ol_node(block, _parts_if(block, BlockType.ORDERED_LIST))
+
+
+def _ol_node(block: str, parts: BlockParts) -> ParentNode:
+    """Builds an <ol> from the items of a list block, or from any numbered lines of the block."""
+    return list_from_items("ol", parts if isinstance(parts, list) else _OL_ITEM_RE.findall(block))
+
+
+def list_from_items(tag: str, items: list[str]) -> ParentNode:
+    """Builds a list ParentNode from the text of its items.
+
+    Args:
+        tag: The list tag, either "ul" or "ol".
+        items: The inline markdown text of each list item.
+
+    Returns:
+        A ParentNode representing the list.
+    """
     list_nodes: list[HTMLNode] = []
-    for item in match:
-        list_nodes.append(ParentNode("li", list(map(text_node_to_html_node, text_to_textnodes(item)))))
-    return ParentNode("ol", list_nodes)
+    for item in items:
+        list_nodes.append(ParentNode("li", list(map(text_node_to_html_node, _inline_textnodes(item)))))
+    return ParentNode(tag, list_nodes)
 
 
 def block_to_paragraph(block: str) -> ParentNode:
@@ -236,4 +344,20 @@ def block_to_paragraph(block: str) -> ParentNode:
         A ParentNode representing the paragraph.
     """
     text = " ".join(block.split("\n"))
-    return ParentNode("p", list(map(text_node_to_html_node, text_to_textnodes(text))))
+    return ParentNode("p", list(map(text_node_to_html_node, _inline_textnodes(text))))
+
+
+def _parts_if(block: str, block_type: BlockType) -> BlockParts:
+    """Returns the parts of a block if it has the given type, and None otherwise."""
+    actual_type, parts = classify_block(block)
+    return parts if actual_type is block_type else None
+
+
+_BLOCK_DISPATCH: dict[BlockType, Callable[[str, BlockParts], ParentNode]] = {
+    BlockType.HEADING: _heading_node,
+    BlockType.CODE: lambda block, _: block_to_code(block),
+    BlockType.QUOTE: _quote_node,
+    BlockType.UNORDERED_LIST: _ul_node,
+    BlockType.ORDERED_LIST: _ol_node,
+    BlockType.PARAGRAPH: lambda block, _: block_to_paragraph(block),
+}
@@ -17,6 +17,8 @@ class HTMLNode:
             (e.g., {"class": "my-class", "id": "my-id"}).
     """
 
+    __slots__ = ("_props_html", "children", "props", "tag", "value")
+
     def __init__(
         self,
         tag: str | None = None,
@@ -36,6 +38,7 @@ class HTMLNode:
         self.value = value
         self.children = children
         self.props = props
+        self._props_html = "" if props is None else " " + " ".join(f'{key}="{value}"' for key, value in props.items())
 
     def __repr__(self) -> str:
         """Returns a string representation of the HTMLNode object.
@@ -57,13 +60,25 @@ class HTMLNode:
         """
         raise NotImplementedError
 
+    def write_html(self, out: list[str]) -> None:
+        """Appends the HTML of the node to a buffer of fragments.
+
+        Nodes with children override this to write their children into the
+        same buffer, so a whole tree is joined only once by the caller.
+
+        Args:
+            out: The list of HTML fragments to append to.
+        """
+        out.append(self.to_html())
+
     def props_to_html(self) -> str:
         """Converts the node's properties to an HTML attribute string.
 
+        The attribute string is built once when the node is created, so
+        props should not be modified afterwards.
+
         Returns:
             str: An HTML attribute string (e.g., ' class="my-class" id="my-id"').
                 Returns an empty string if there are no properties.
         """
-        if self.props is None:
-            return ""
-        return " " + " ".join(f'{key}="{value}"' for key, value in self.props.items())
+        return self._props_html
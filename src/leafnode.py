@@ -20,6 +20,8 @@ class LeafNode(HTMLNode):
             (e.g., {"class": "my-class", "id": "my-id"}).
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str, tag: str | None, props: dict[str, str] | None = None) -> None:
         """Initializes a LeafNode object.
 
@@ -49,6 +51,28 @@ class LeafNode(HTMLNode):
         """
         if self.value is None:
             raise ValueError("All leaf nodes must have a value.")
-        if self.tag is None:
+        tag = self.tag
+        if tag is None:
             return self.value
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+        return f"<{tag}{self._props_html}>{self.value}</{tag}>"
+
+    def write_html(self, out: list[str]) -> None:
+        """Appends the fragments of the leaf node's HTML to a buffer.
+
+        The fragments are appended directly rather than joined into a string
+        first, since the caller joins the whole buffer once.
+
+        Args:
+            out: The list of HTML fragments to append to.
+
+        Raises:
+            ValueError: If the leaf node does not have a value.
+        """
+        value = self.value
+        if value is None:
+            raise ValueError("All leaf nodes must have a value.")
+        tag = self.tag
+        if tag is None:
+            out.append(value)
+        else:
+            out += ("<", tag, self._props_html, ">", value, "</", tag, ">")
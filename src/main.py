@@ -5,29 +5,44 @@ including the `main` function and the `text_node_to_html_node` function.
 It handles the conversion of TextNode objects to LeafNode objects,
 which represent HTML elements.
 
-Usage: python main.py
+Usage: python main.py [basepath]
+       python main.py serve <socket path>
 """
 
+import os
+import re
 import shutil
+import socketserver
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from blocks import markdown_to_html_node
 from parsing import extract_title
 
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PAGE_WORKERS = os.cpu_count() or 1
+# starting a process pool costs several milliseconds, more than converting
+# dozens of pages, so small sites are generated in this process
+PARALLEL_PAGE_THRESHOLD = 64
+_ROOT_LINK_RE = re.compile(r'(href|src)="/')
+_PLACEHOLDER_RE = re.compile(r"\{\{ (Title|Content) \}\}")
+
 
 def delete_files(directory: Path) -> None:
-    """Recursively deletes all files and directories in path."""
-    for root, dirs, files in directory.walk(top_down=False):
-        for name in files:
-            (root / name).unlink()
-        for name in dirs:
-            (root / name).rmdir()
+    """Recursively deletes all files and directories in path, leaving it empty."""
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True, exist_ok=True)
 
 
 def copy_tree(src: Path, dest: Path) -> None:
     """Copies the contents from a source directory to a desination directory.
 
+    Directories are created in order and the files are copied concurrently
+    on a thread pool, since the copies spend their time in system calls.
+
     Args:
         src: The source directory path.
         dest: The destination directory path.
@@ -41,33 +56,33 @@ def copy_tree(src: Path, dest: Path) -> None:
     if not src.is_dir():
         raise ValueError(f"Source path '{src}' is not a directory or does not exist.")
 
-    # copy files
-    for dirpath, dirs, files in src.walk():
-        relative_path = dirpath.relative_to(src)
-        dest_dir = dest / relative_path
-        # create all directories
-        for name in dirs:
-            dest_subdir = dest_dir / name
-            try:
-                dest_subdir.mkdir(exist_ok=True)
-            except OSError as e:
-                print(f"Error creating directory '{dest_subdir}': {e}")
-        # copy files
-        for name in files:
-            src_file = dirpath / name
-            dest_file = dest_dir / name
-            if src_file.is_file():
-                try:
-                    shutil.copy(src_file, dest_file)
-                except (shutil.Error, OSError) as e:
-                    print(f"Error copying file '{src_file}' to '{dest_file}': {e}")
+    # copytree creates the directories serially; file copies run on the pool
+    copies: dict[Future[object], tuple[str, str]] = {}
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+
+        def submit_copy(src_file: str, dest_file: str) -> str:
+            copies[executor.submit(shutil.copyfile, src_file, dest_file)] = (src_file, dest_file)
+            return dest_file
+
+        try:
+            shutil.copytree(src, dest, copy_function=submit_copy, dirs_exist_ok=True)
+        except shutil.Error as e:
+            for src_file, dest_file, reason in e.args[0]:
+                print(f"Error copying file '{src_file}' to '{dest_file}': {reason}")
+    for future, (src_file, dest_file) in copies.items():
+        if (error := future.exception()) is not None:
+            print(f"Error copying file '{src_file}' to '{dest_file}': {error}")
 
 
 def copy_and_convert_pages(src: Path, template_path: Path, dest: Path, basepath: str) -> None:
     """Converts all markdown files in directory tree to html.
 
     Walks through a directory and takes all markdown files, converts them to
-    html, and creates the html files in the destination directory.
+    html, and creates the html files in the destination directory. The
+    template is read once. Sites with at least PARALLEL_PAGE_THRESHOLD pages
+    are generated in parallel on a process pool when more than one CPU is
+    available, since each page is converted independently; smaller sites
+    are generated serially.
 
     Args:
         src: The source directory path.
@@ -75,6 +90,8 @@ def copy_and_convert_pages(src: Path, template_path: Path, dest: Path, basepath:
         dest: The destination directory path.
         basepath: The base path of the site for hosting.
     """
+    src_files: list[Path] = []
+    dest_files: list[Path] = []
     for dirpath, _, files in src.walk():
         relative_path = dirpath.relative_to(src)
         dest_dir = dest / relative_path
@@ -83,7 +100,19 @@ def copy_and_convert_pages(src: Path, template_path: Path, dest: Path, basepath:
                 continue
             src_file = dirpath / file
             dest_file = dest_dir / "index.html"
-            generate_page(src_file, template_path, dest_file, basepath)
+            print(f"Generating page from {src_file} to {dest_file} using {template_path}")
+            src_files.append(src_file)
+            dest_files.append(dest_file)
+    if not src_files:
+        return
+    with template_path.open("rt", encoding="utf-8") as template_file:
+        template = split_template(template_file.read(), basepath)
+    if PAGE_WORKERS == 1 or len(src_files) < PARALLEL_PAGE_THRESHOLD:
+        for src_file, dest_file in zip(src_files, dest_files, strict=True):
+            generate_page_from_template(src_file, template, dest_file, basepath)
+        return
+    with ProcessPoolExecutor(max_workers=min(PAGE_WORKERS, len(src_files))) as executor:
+        list(executor.map(generate_page_from_template, src_files, repeat(template), dest_files, repeat(basepath)))
 
 
 def generate_page(from_path: Path, template_path: Path, dest_path: Path, basepath: str) -> None:
@@ -96,25 +125,85 @@ def generate_page(from_path: Path, template_path: Path, dest_path: Path, basepat
         basepath: The base path of the site for hosting.
     """
     print(f"Generating page from {from_path} to {dest_path} using {template_path}")
+    with template_path.open("rt", encoding="utf-8") as file:
+        template = split_template(file.read(), basepath)
+    generate_page_from_template(from_path, template, dest_path, basepath)
+
+
+def split_template(template: str, basepath: str) -> tuple[list[bytes], list[str]]:
+    """Splits a page template around its title and content placeholders.
+
+    Every occurrence of each placeholder is found, in any order. Root-relative
+    links in the template are pointed at the base path and the fragments are
+    encoded as UTF-8 here, so each page only has to rewrite and encode its
+    own title and content.
+
+    Args:
+        template: The contents of the template file.
+        basepath: The base path of the site for hosting.
+
+    Returns:
+        The encoded template fragments and the names ("Title" or "Content")
+        of the placeholders between them. There is always one more fragment
+        than there are placeholders.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    fragments = [rebase_links(fragment, basepath).encode("utf-8") for fragment in parts[::2]]
+    return fragments, parts[1::2]
+
+
+def rebase_links(html: str, basepath: str) -> str:
+    """Points root-relative href and src attributes at the base path.
+
+    Both attributes are rewritten in a single pass over the html.
+
+    Args:
+        html: The html to rewrite.
+        basepath: The base path of the site for hosting.
+
+    Returns:
+        The html with every 'href="/' and 'src="/' prefixed by the base path.
+    """
+    return _ROOT_LINK_RE.sub(lambda match: f'{match[1]}="{basepath}', html)
+
+
+def generate_page_from_template(
+    from_path: Path, template: tuple[list[bytes], list[str]], dest_path: Path, basepath: str
+) -> None:
+    """Convert a markdown page to an html page using an already split template.
+
+    Args:
+        from_path: The path to the markdown file.
+        template: The template fragments and placeholders returned by
+            split_template.
+        dest_path: The path to save the html file.
+        basepath: The base path of the site for hosting.
+    """
     with from_path.open("rt", encoding="utf-8") as file:
         markdown = file.read()
-    with template_path.open("rt", encoding="utf-8") as file:
-        html = file.read()
-    content = markdown_to_html_node(markdown).to_html()
-    title = extract_title(markdown)
-    html = html.replace("{{ Title }}", title)
-    html = html.replace("{{ Content }}", content)
-    html = html.replace('href="/', f'href="{basepath}')
-    html = html.replace('src="/', f'src="{basepath}')
+    # the tree is written into one buffer and joined once, so links can be
+    # rebased in a single pass over the whole page body
+    out: list[str] = []
+    markdown_to_html_node(markdown).write_html(out)
+    values = {
+        "Title": rebase_links(extract_title(markdown), basepath).encode("utf-8"),
+        "Content": rebase_links("".join(out), basepath).encode("utf-8"),
+    }
+    fragments, placeholders = template
+    parts = [fragments[0]]
+    for placeholder, fragment in zip(placeholders, fragments[1:], strict=True):
+        parts += (values[placeholder], fragment)
     # create the file and any necessary directories
     dest_path.parent.mkdir(parents=True, exist_ok=True)
-    with dest_path.open("wt", encoding="utf-8") as file:
-        file.write(html)
+    dest_path.write_bytes(b"".join(parts))
 
 
-def main() -> None:
-    """Entry point for the static site generator."""
-    basepath = "/" if len(sys.argv) == 1 else sys.argv[1]
+def build(basepath: str) -> None:
+    """Builds the site from the content, static, and template directories.
+
+    Args:
+        basepath: The base path of the site for hosting.
+    """
     dir_path_static = Path("./static")
     dir_path_content = Path("./content")
     template_path = Path("./templates/template.html")
@@ -127,5 +216,63 @@ def main() -> None:
     copy_and_convert_pages(dir_path_content, template_path, dir_path_public, basepath)
 
 
+class BuildRequestHandler(socketserver.StreamRequestHandler):
+    """Rebuilds the site for each request received by the build server.
+
+    A request is a single line holding the base path to build with; an empty
+    line builds with "/". The handler replies with "ok" or the error message.
+    """
+
+    def handle(self) -> None:
+        """Reads the base path from the client and runs a build."""
+        line = self.rfile.readline()
+        try:
+            build(line.decode("utf-8").strip() or "/")
+        except Exception as e:
+            self.wfile.write(f"error: {e}\n".encode())
+        else:
+            self.wfile.write(b"ok\n")
+
+
+def serve(socket_path: Path) -> None:
+    """Runs builds on request from a Unix socket until interrupted.
+
+    Keeping one process alive between builds avoids paying interpreter
+    startup and module imports on every rebuild. Sites smaller than
+    PARALLEL_PAGE_THRESHOLD pages are parsed in this process, so the inline
+    parsing cache also carries over between their builds; larger sites are
+    parsed on a fresh process pool each time. Trigger a build with, e.g.,
+    `echo /static-site-gen/ | nc -U build.sock`.
+
+    A stale socket left at the path by an earlier server is replaced, but any
+    other file there is left alone and the server exits with an error.
+
+    Args:
+        socket_path: The path of the Unix socket to listen on.
+    """
+    if socket_path.is_socket():
+        socket_path.unlink()
+    elif socket_path.exists() or socket_path.is_symlink():
+        sys.exit(f"Cannot serve on {socket_path}: the path exists and is not a socket.")
+    with socketserver.UnixStreamServer(str(socket_path), BuildRequestHandler) as server:
+        print(f"Listening for build requests on {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            if socket_path.is_socket():
+                socket_path.unlink()
+
+
+def main() -> None:
+    """Entry point for the static site generator."""
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        if len(sys.argv) != 3:
+            sys.exit("Usage: python main.py serve <socket path>")
+        serve(Path(sys.argv[2]))
+        return
+    basepath = "/" if len(sys.argv) == 1 else sys.argv[1]
+    build(basepath)
+
+
 if __name__ == "__main__":
     main()
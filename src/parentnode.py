@@ -4,6 +4,8 @@ This module defines the ParentNode class, which is a subclass of HTMLNode
 and represents HTML elements that can have child elements.
 """
 
+from collections.abc import Iterator
+
 from htmlnode import HTMLNode
 
 
@@ -20,6 +22,8 @@ class ParentNode(HTMLNode):
             (e.g., {"class": "my-class", "id": "my-id"}).
     """
 
+    __slots__ = ()
+
     def __init__(self, tag: str, children: list["HTMLNode"], props: dict[str, str] | None = None) -> None:
         """Initializes a ParentNode object.
 
@@ -45,6 +49,50 @@ class ParentNode(HTMLNode):
             str: The HTML string representation of the parent node,
                 including its children.
 
+        Raises:
+            ValueError: If the parent node does not have a tag.
+            ValueError: If the parent node is missing child nodes.
+        """
+        out: list[str] = []
+        self.write_html(out)
+        return "".join(out)
+
+    def write_html(self, out: list[str]) -> None:
+        """Appends the opening tag, the children, and the closing tag to a buffer.
+
+        The subtree is walked with an explicit stack rather than by recursing
+        into each child ParentNode, so deeply nested trees do not run into the
+        interpreter's recursion limit. Other nodes write themselves.
+
+        Args:
+            out: The list of HTML fragments to append to.
+
+        Raises:
+            ValueError: If a parent node does not have a tag.
+            ValueError: If a parent node is missing child nodes.
+        """
+        # each entry is a parent's remaining children and its closing tag
+        stack = [self._write_open_tag(out)]
+        while stack:
+            children, close = stack[-1]
+            for child in children:
+                if isinstance(child, ParentNode):
+                    stack.append(child._write_open_tag(out))
+                    break
+                child.write_html(out)
+            else:
+                out.append(close)
+                stack.pop()
+
+    def _write_open_tag(self, out: list[str]) -> tuple[Iterator[HTMLNode], str]:
+        """Appends the opening tag and returns the children and closing tag.
+
+        Args:
+            out: The list of HTML fragments to append to.
+
+        Returns:
+            An iterator over the node's children and the node's closing tag.
+
         Raises:
             ValueError: If the parent node does not have a tag.
             ValueError: If the parent node is missing child nodes.
@@ -53,4 +101,5 @@ class ParentNode(HTMLNode):
             raise ValueError("Parent nodes must have a tag.")
         if self.children is None:
             raise ValueError("Parent node missing child nodes.")
-        return f"<{self.tag}{self.props_to_html()}>{''.join(child.to_html() for child in self.children)}</{self.tag}>"
+        out.append(f"<{self.tag}{self._props_html}>")
+        return iter(self.children), f"</{self.tag}>"
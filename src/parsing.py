@@ -1,11 +1,31 @@
 """Text parsing utility functions."""
 
 import re
+from collections.abc import Callable
 
 from textnode import TextNode, TextType
 
+# enum members bound once, so the hot loops skip the attribute lookup on TextType
+_TEXT = TextType.TEXT
+_BOLD = TextType.BOLD
+_ITALIC = TextType.ITALIC
+_CODE = TextType.CODE
+_LINK = TextType.LINK
+_IMAGE = TextType.IMAGE
 
-def split_nodes_delimiter(old_nodes: list["TextNode"], delimiter: str, text_type: TextType) -> list["TextNode"]:
+_IMAGE_RE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+_LINK_RE = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+# inline delimiters in the order they take precedence
+_INLINE_DELIMITERS = (("**", _BOLD), ("_", _ITALIC), ("*", _ITALIC), ("`", _CODE))
+
+
+class UnmatchedDelimiterError(Exception):
+    """Raised when inline markdown has an opening delimiter without a closing one."""
+
+
+def split_nodes_delimiter(
+    old_nodes: list["TextNode"], delimiter: str, text_type: TextType, drop_empty: bool = False
+) -> list["TextNode"]:
     """Splits a list of TextNodes based on a delimiter and assigns a new TextType.
 
     This function takes a list of TextNodes and splits any TextNodes with
@@ -17,31 +37,33 @@ def split_nodes_delimiter(old_nodes: list["TextNode"], delimiter: str, text_type
         old_nodes: A list of TextNode objects to be parsed.
         delimiter: The delimiter string used to split the text.
         text_type: The TextType to assign to text between delimiters.
+        drop_empty: Whether to leave out the empty `TextType.TEXT` nodes that
+            a delimiter at the start or end of a text, or two adjacent
+            delimited spans, would otherwise produce. Defaults to False.
 
     Returns:
         A new list of TextNode objects with the text split and new types assigned.
 
     Raises:
-        Exception: If an odd number of delimiters is found in a TextNode's text,
-            indicating unmatched delimiters.
+        UnmatchedDelimiterError: If an odd number of delimiters is found in a
+            TextNode's text, indicating unmatched delimiters.
     """
-    parsed_nodes = []
+    parsed_nodes: list[TextNode] = []
+    append = parsed_nodes.append
+    plain = _TEXT
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            parsed_nodes.append(node)
+        if node.text_type is not plain or delimiter not in node.text:
+            append(node)
             continue
-        new_nodes = []
-        text = node.text
-        if text.count(delimiter) % 2 != 0:
-            raise Exception(f"Invalid Markdown: Unmatched {delimiter} delimiter.")
-        chunks = text.split(delimiter)
+        chunks = node.text.split(delimiter)
+        # an even number of chunks means an odd number of delimiters
+        if len(chunks) % 2 == 0:
+            raise UnmatchedDelimiterError(f"Invalid Markdown: Unmatched {delimiter} delimiter.")
         for i, chunk in enumerate(chunks):
-            if i % 2 == 0:
-                new_nodes.append(TextNode(chunk, TextType.TEXT))
-            else:
-                new_nodes.append(TextNode(chunk, text_type))
-
-        parsed_nodes.extend(new_nodes)
+            if i % 2 == 1:
+                append(TextNode(chunk, text_type))
+            elif chunk or not drop_empty:
+                append(TextNode(chunk, plain))
     return parsed_nodes
 
 
@@ -61,27 +83,14 @@ def split_nodes_link(old_nodes: list["TextNode"]) -> list["TextNode"]:
         A new list of TextNode objects with the text split and links
         converted to `TextType.LINK`.
     """
-    parsed_nodes = []
+    parsed_nodes: list[TextNode] = []
+    append = parsed_nodes.append
+    plain = _TEXT
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            parsed_nodes.append(node)
-            continue
-        new_nodes = []
-        text = node.text
-        links = extract_markdown_links(text)
-        if not links:
-            parsed_nodes.append(TextNode(text, TextType.TEXT))
+        if node.text_type is not plain:
+            append(node)
             continue
-        for anchor_text, link_url in links:
-            before, after = text.split(f"[{anchor_text}]({link_url})", 1)
-            if len(before) > 0:
-                new_nodes.append(TextNode(before, TextType.TEXT))
-            new_nodes.append(TextNode(anchor_text, TextType.LINK, link_url))
-            text = after
-        if len(text) > 0:
-            new_nodes.append(TextNode(text, TextType.TEXT))
-
-        parsed_nodes.extend(new_nodes)
+        _append_matches(node.text, _LINK_RE, _LINK, parsed_nodes, _append_text)
     return parsed_nodes
 
 
@@ -101,27 +110,14 @@ def split_nodes_image(old_nodes: list["TextNode"]) -> list["TextNode"]:
         A new list of TextNode objects with the text split and images
         converted to `TextType.IMAGE`.
     """
-    parsed_nodes = []
+    parsed_nodes: list[TextNode] = []
+    append = parsed_nodes.append
+    plain = _TEXT
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            parsed_nodes.append(node)
+        if node.text_type is not plain:
+            append(node)
             continue
-        new_nodes = []
-        text = node.text
-        images = extract_markdown_images(text)
-        if not images:
-            parsed_nodes.append(TextNode(text, TextType.TEXT))
-            continue
-        for alt_text, image_url in images:
-            before, after = text.split(f"![{alt_text}]({image_url})", 1)
-            if len(before) > 0:
-                new_nodes.append(TextNode(before, TextType.TEXT))
-            new_nodes.append(TextNode(alt_text, TextType.IMAGE, image_url))
-            text = after
-        if len(text) > 0:
-            new_nodes.append(TextNode(text, TextType.TEXT))
-
-        parsed_nodes.extend(new_nodes)
+        _append_matches(node.text, _IMAGE_RE, _IMAGE, parsed_nodes, _append_text)
     return parsed_nodes
 
 
@@ -140,7 +136,7 @@ def extract_markdown_images(text: str) -> list[tuple[str, str]]:
         empty list.
         For example: [("alt text", "https://example.com/image.png")]
     """
-    return re.findall(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return _IMAGE_RE.findall(text)
 
 
 def extract_markdown_links(text: str) -> list[tuple[str, str]]:
@@ -159,7 +155,7 @@ def extract_markdown_links(text: str) -> list[tuple[str, str]]:
         empty list.
         For example: [("anchor text", "https://example.com")]
     """
-    return re.findall(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return _LINK_RE.findall(text)
 
 
 def text_to_textnodes(text: str) -> list["TextNode"]:
@@ -170,28 +166,111 @@ def text_to_textnodes(text: str) -> list["TextNode"]:
     images. It then converts these elements into a list of TextNode
     objects, each representing a segment of the original text with
     its corresponding type and any associated data (e.g., URLs for
-    links and images).
+    links and images). Each segment of the text is carried through every
+    delimiter, image, and link pass before the next segment is parsed.
+    Empty plain text between delimiters is not turned into nodes.
 
     Args:
         text: The input string of text to be parsed.
 
     Returns:
         A list of TextNode objects representing the parsed text.
+
+    Raises:
+        UnmatchedDelimiterError: If the text contains an unmatched delimiter.
     """
-    nodes = [TextNode(text, TextType.TEXT)]
-    delimiters = ("**", "_", "*", "`")
-    text_types = (TextType.BOLD, TextType.ITALIC, TextType.ITALIC, TextType.CODE)
-    for delimiter, text_type in zip(delimiters, text_types, strict=False):
-        nodes = split_nodes_delimiter(nodes, delimiter, text_type)
-    nodes = split_nodes_image(nodes)
-    nodes = split_nodes_link(nodes)
-    return nodes
+    nodes: list[TextNode] = []
+    try:
+        _append_inline(text, 0, nodes)
+        return nodes
+    except UnmatchedDelimiterError as e:
+        error = e
+    # rerun the passes one at a time so that, when several delimiters are
+    # unmatched, the error names the one with the highest precedence; this
+    # happens outside the handler so the error is not chained to the first
+    nodes = [TextNode(text, _TEXT)]
+    for delimiter, text_type in _INLINE_DELIMITERS:
+        nodes = split_nodes_delimiter(nodes, delimiter, text_type, drop_empty=True)
+    raise error
+
+
+def _append_inline(text: str, level: int, out: list[TextNode]) -> None:
+    """Appends the inline nodes of a text to a list in a single pass.
+
+    The text is split on the delimiter at the given precedence level. The
+    text outside each delimited span is split on the following levels and
+    then searched for images and links, without building intermediate node
+    lists for each pass.
+
+    Args:
+        text: The text to parse.
+        level: The index into the inline delimiters to split on next.
+        out: The list the parsed nodes are appended to.
+
+    Raises:
+        UnmatchedDelimiterError: If the text contains an unmatched delimiter.
+    """
+    # skip the levels whose delimiter does not occur in the text at all
+    while level < len(_INLINE_DELIMITERS) and _INLINE_DELIMITERS[level][0] not in text:
+        level += 1
+    if level == len(_INLINE_DELIMITERS):
+        _append_matches(text, _IMAGE_RE, _IMAGE, out, _append_links)
+        return
+    delimiter, text_type = _INLINE_DELIMITERS[level]
+    chunks = text.split(delimiter)
+    if len(chunks) % 2 == 0:
+        raise UnmatchedDelimiterError(f"Invalid Markdown: Unmatched {delimiter} delimiter.")
+    for i, chunk in enumerate(chunks):
+        if i % 2 == 1:
+            out.append(TextNode(chunk, text_type))
+        elif chunk:
+            _append_inline(chunk, level + 1, out)
+
+
+def _append_matches(
+    text: str,
+    pattern: re.Pattern[str],
+    text_type: TextType,
+    out: list[TextNode],
+    append_text: Callable[[str, list[TextNode]], None],
+) -> None:
+    """Appends a node for each pattern match and hands the text between matches on.
+
+    Args:
+        text: The text to search.
+        pattern: A pattern capturing the node text and URL.
+        text_type: The TextType of the nodes created for matches.
+        out: The list the nodes are appended to.
+        append_text: Called with each piece of text outside the matches.
+    """
+    last_end = 0
+    for match in pattern.finditer(text):
+        if match.start() > last_end:
+            append_text(text[last_end : match.start()], out)
+        out.append(TextNode(match.group(1), text_type, match.group(2)))
+        last_end = match.end()
+    if last_end == 0:
+        append_text(text, out)
+    elif last_end < len(text):
+        append_text(text[last_end:], out)
+
+
+def _append_text(text: str, out: list[TextNode]) -> None:
+    """Appends a plain text node to a list."""
+    out.append(TextNode(text, _TEXT))
+
+
+def _append_links(text: str, out: list[TextNode]) -> None:
+    """Appends the link and plain text nodes of a text to a list."""
+    _append_matches(text, _LINK_RE, _LINK, out, _append_text)
 
 
 def extract_title(markdown: str) -> str:
     """Extracts the title from a markdown file.
 
-    Finds the first h1 header and returns the value as the title.
+    Finds the first h1 header and returns the value as the title. The
+    header is located with prefix and substring searches rather than by
+    splitting the whole document into lines.
 
     Args:
         markdown: The markdown file to be parsed.
@@ -202,8 +281,12 @@ def extract_title(markdown: str) -> str:
     Raises:
         Exception: If no valid title is found in the markdown file.
     """
-    lines = markdown.split("\n")
-    for line in lines:
-        if line.startswith("# "):
-            return line[2:].strip()
-    raise Exception("markdown does not contain h1 title")
+    if markdown.startswith("# "):
+        start = 2
+    else:
+        start = markdown.find("\n# ")
+        if start == -1:
+            raise Exception("markdown does not contain h1 title")
+        start += 3
+    end = markdown.find("\n", start)
+    return markdown[start : end if end != -1 else None].strip()
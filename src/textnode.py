@@ -7,6 +7,8 @@ links.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum, auto
 
 from leafnode import LeafNode
@@ -32,39 +34,23 @@ class TextType(Enum):
     IMAGE = auto()
 
 
+@dataclass(slots=True, repr=False)
 class TextNode:
     """Represents a node of text with a specific type and optional URL.
 
+    Equality is generated by the dataclass and compares the text, text type,
+    and URL. Nodes are not frozen, since a frozen dataclass has to go through
+    object.__setattr__ for every field when the parser creates a node.
+
     Attributes:
         text: The text content of the node.
         text_type: The type of the text (e.g., normal, bold, link).
         url: An optional URL associated with the text (e.g., for links).
     """
 
-    def __init__(self, text: str, text_type: TextType, url: str | None = None):
-        """Initializes a TextNode object.
-
-        Args:
-            text: The text content of the node.
-            text_type: The type of the text.
-            url: An optional URL associated with the text.
-        """
-        self.text = text
-        self.text_type = text_type
-        self.url = url
-
-    def __eq__(self, other: object) -> bool:
-        """Checks if two TextNode objects are equal.
-
-        Args:
-            other: The other TextNode object to compare to.
-
-        Returns:
-            True if the two TextNode objects are equal, False otherwise.
-        """
-        if not isinstance(other, TextNode):
-            return NotImplemented
-        return self.text == other.text and self.text_type == other.text_type and self.url == other.url
+    text: str
+    text_type: TextType
+    url: str | None = None
 
     def __repr__(self) -> str:
         """Returns a string representation of the TextNode object.
@@ -91,23 +77,30 @@ def text_node_to_html_node(text_node: TextNode) -> LeafNode:
     Raises:
         Exception: If the TextNode has an unknown text type.
     """
-    match text_node.text_type:
-        case TextType.TEXT:
-            return LeafNode(text_node.text, None)
-        case TextType.BOLD:
-            return LeafNode(text_node.text, "b")
-        case TextType.ITALIC:
-            return LeafNode(text_node.text, "i")
-        case TextType.CODE:
-            return LeafNode(text_node.text, "code")
-        case TextType.LINK:
-            url = text_node.url if text_node.url is not None else ""
-            props = {"href": url}
-            return LeafNode(text_node.text, "a", props)
-        case TextType.IMAGE:
-            url = text_node.url if text_node.url is not None else ""
-            alt_text = text_node.text if text_node.text is not None else ""
-            props = {"src": url, "alt": alt_text}
-            return LeafNode("", "img", props)
-        case _:
-            raise Exception("Unknown text type.")
+    handler = _HANDLERS.get(text_node.text_type)
+    if handler is None:
+        raise Exception("Unknown text type.")
+    return handler(text_node)
+
+
+def _link_to_html_node(text_node: TextNode) -> LeafNode:
+    """Converts a link TextNode to an anchor LeafNode."""
+    url = text_node.url if text_node.url is not None else ""
+    return LeafNode(text_node.text, "a", {"href": url})
+
+
+def _image_to_html_node(text_node: TextNode) -> LeafNode:
+    """Converts an image TextNode to an img LeafNode."""
+    url = text_node.url if text_node.url is not None else ""
+    alt_text = text_node.text if text_node.text is not None else ""
+    return LeafNode("", "img", {"src": url, "alt": alt_text})
+
+
+_HANDLERS: dict[TextType, Callable[[TextNode], LeafNode]] = {
+    TextType.TEXT: lambda node: LeafNode(node.text, None),
+    TextType.BOLD: lambda node: LeafNode(node.text, "b"),
+    TextType.ITALIC: lambda node: LeafNode(node.text, "i"),
+    TextType.CODE: lambda node: LeafNode(node.text, "code"),
+    TextType.LINK: _link_to_html_node,
+    TextType.IMAGE: _image_to_html_node,
+}
@@ -1,11 +1,18 @@
 import unittest
 
-from blocks import BlockType, block_to_block_type, markdown_to_blocks, markdown_to_html_node
-
-
-class TestMarkdownToBlocks(unittest.TestCase):
-    def test_markdown_to_blocks(self):
-        md = """
+from blocks import (
+    BlockType,
+    block_to_block_type,
+    block_to_heading,
+    block_to_ol,
+    block_to_quote,
+    block_to_ul,
+    classify_block,
+    markdown_to_blocks,
+    markdown_to_html_node,
+)
+
+MD_PARAGRAPHS_AND_LIST = """
 This is **bolded** paragraph
 
 This is another paragraph with _italic_ text and `code` here
@@ -14,48 +21,27 @@ This is the same paragraph on a new line
 - This is a list
 - with items
 """
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            [
-                "This is **bolded** paragraph",
-                "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
-                "- This is a list\n- with items",
-            ],
-        )
-
-    def test_empty_markdown(self):
-        md = ""
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(blocks, [])
-
-    def test_single_paragraph(self):
-        md = "This is a single paragraph."
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(blocks, ["This is a single paragraph."])
+EXPECTED_PARAGRAPHS_AND_LIST = [
+    "This is **bolded** paragraph",
+    "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
+    "- This is a list\n- with items",
+]
 
-    def test_multiple_paragraphs(self):
-        md = """
+MD_MULTIPLE_PARAGRAPHS = """
 Paragraph 1
 
 Paragraph 2
 
 Paragraph 3
 """
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(blocks, ["Paragraph 1", "Paragraph 2", "Paragraph 3"])
+EXPECTED_MULTIPLE_PARAGRAPHS = ["Paragraph 1", "Paragraph 2", "Paragraph 3"]
 
-    def test_leading_and_trailing_whitespace(self):
-        md = """
+MD_LEADING_AND_TRAILING_WHITESPACE = """
    Paragraph 1 
 
   Paragraph 2  
 """  # noqa: W291
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(blocks, ["Paragraph 1", "Paragraph 2"])
-
-    def test_empty_paragraphs(self):
-        md = """
+MD_EMPTY_PARAGRAPHS = """
 Paragraph 1
 
 
@@ -63,11 +49,9 @@ Paragraph 2
 
 
 """
-        blocks = markdown_to_blocks(md)
-        self.assertEqual(blocks, ["Paragraph 1", "Paragraph 2"])
+EXPECTED_TWO_PARAGRAPHS = ["Paragraph 1", "Paragraph 2"]
 
-    def test_mixed_content(self):
-        md = """
+MD_MIXED = """
 # Heading 1
 
 This is a paragraph with **bold** text.
@@ -77,11 +61,102 @@ This is a paragraph with **bold** text.
 
 ## Heading 2
 """
+EXPECTED_MIXED = [
+    "# Heading 1",
+    "This is a paragraph with **bold** text.",
+    "- List item 1\n- List item 2",
+    "## Heading 2",
+]
+
+MD_MULTIPLE_LINE_BREAKS = """
+This is a paragraph with a line break
+in the middle
+
+This is another paragraph
+with a line break
+"""
+EXPECTED_MULTIPLE_LINE_BREAKS = [
+    "This is a paragraph with a line break\nin the middle",
+    "This is another paragraph\nwith a line break",
+]
+
+
+# markdown_to_html_node cases, rendered once per test class: name -> (markdown, expected html)
+HTML_CASES = {
+    "paragraphs": (
+        """
+This is **bolded** paragraph
+text in a p
+tag here
+
+This is another paragraph with _italic_ text and `code` here
+
+""",
+        "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
+    ),
+    "codeblock": (
+        """
+```
+This is text that _should_ remain
+the **same** even with inline stuff
+```
+""",
+        "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>",
+    ),
+    "codeblock_indented_blank_line": (
+        "```\ndef f():\n    x = 1\n    \n    return x\n```",
+        "<div><pre><code>def f():\n    x = 1\n    \n    return x\n</code></pre></div>",
+    ),
+    "heading": ("# This is a heading", "<div><h1>This is a heading</h1></div>"),
+    "unordered_list": (
+        """
+- Item 1
+- Item 2
+- Item 3
+""",
+        "<div><ul><li>Item 1</li><li>Item 2</li><li>Item 3</li></ul></div>",
+    ),
+    "ordered_list": (
+        """
+1. Item 1
+2. Item 2
+3. Item 3
+""",
+        "<div><ol><li>Item 1</li><li>Item 2</li><li>Item 3</li></ol></div>",
+    ),
+    "quote": (
+        """> This is a quote
+> with multiple lines""",
+        "<div><blockquote>This is a quote with multiple lines</blockquote></div>",
+    ),
+}
+
+
+class TestMarkdownToBlocks(unittest.TestCase):
+    def test_markdown_to_blocks(self):
+        self.assertEqual(markdown_to_blocks(MD_PARAGRAPHS_AND_LIST), EXPECTED_PARAGRAPHS_AND_LIST)
+
+    def test_empty_markdown(self):
+        md = ""
         blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            ["# Heading 1", "This is a paragraph with **bold** text.", "- List item 1\n- List item 2", "## Heading 2"],
-        )
+        self.assertEqual(blocks, [])
+
+    def test_single_paragraph(self):
+        md = "This is a single paragraph."
+        blocks = markdown_to_blocks(md)
+        self.assertEqual(blocks, ["This is a single paragraph."])
+
+    def test_multiple_paragraphs(self):
+        self.assertEqual(markdown_to_blocks(MD_MULTIPLE_PARAGRAPHS), EXPECTED_MULTIPLE_PARAGRAPHS)
+
+    def test_leading_and_trailing_whitespace(self):
+        self.assertEqual(markdown_to_blocks(MD_LEADING_AND_TRAILING_WHITESPACE), EXPECTED_TWO_PARAGRAPHS)
+
+    def test_empty_paragraphs(self):
+        self.assertEqual(markdown_to_blocks(MD_EMPTY_PARAGRAPHS), EXPECTED_TWO_PARAGRAPHS)
+
+    def test_mixed_content(self):
+        self.assertEqual(markdown_to_blocks(MD_MIXED), EXPECTED_MIXED)
 
     def test_only_whitespace(self):
         md = "   \n\n   \n\n"
@@ -93,19 +168,13 @@ This is a paragraph with **bold** text.
         blocks = markdown_to_blocks(md)
         self.assertEqual(blocks, ["This is a single line\nThis is the second line"])
 
-    def test_multiple_line_breaks(self):
-        md = """
-This is a paragraph with a line break
-in the middle
-
-This is another paragraph
-with a line break
-"""
+    def test_whitespace_only_line_does_not_separate_blocks(self):
+        md = "```\ndef f():\n    x = 1\n    \n    return x\n```"
         blocks = markdown_to_blocks(md)
-        self.assertEqual(
-            blocks,
-            ["This is a paragraph with a line break\nin the middle", "This is another paragraph\nwith a line break"],
-        )
+        self.assertEqual(blocks, [md])
+
+    def test_multiple_line_breaks(self):
+        self.assertEqual(markdown_to_blocks(MD_MULTIPLE_LINE_BREAKS), EXPECTED_MULTIPLE_LINE_BREAKS)
 
 
 # This is not implemented correctly yet. Need to decide how we want to handle cases like this
@@ -207,43 +276,20 @@ This is not a quote."""
         block = "print('Hello, world!')\n```"
         self.assertEqual(block_to_block_type(block), BlockType.PARAGRAPH)
 
-    def test_paragraphs(self):
-        md = """
-This is **bolded** paragraph
-text in a p
-tag here
 
-This is another paragraph with _italic_ text and `code` here
+class TestMarkdownToHtmlNode(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.html = {name: markdown_to_html_node(md).to_html() for name, (md, _) in HTML_CASES.items()}
 
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
-        )
+    def test_paragraphs(self):
+        self.assertEqual(self.html["paragraphs"], HTML_CASES["paragraphs"][1])
 
     def test_codeblock(self):
-        md = """
-```
-This is text that _should_ remain
-the **same** even with inline stuff
-```
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(
-            html,
-            "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>",
-        )
+        self.assertEqual(self.html["codeblock"], HTML_CASES["codeblock"][1])
 
     def test_heading(self):
-        md = "# This is a heading"
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(html, "<div><h1>This is a heading</h1></div>")
+        self.assertEqual(self.html["heading"], HTML_CASES["heading"][1])
 
     # Not yet implemented due to how we're currently parsing blocks
     #     def test_multiple_headings(self):
@@ -257,31 +303,74 @@ the **same** even with inline stuff
     #         self.assertEqual(html, "<div><h1>Heading 1</h1><h2>Heading 2</h2><h3>Heading 3</h3></div>")
 
     def test_markdown_unordered_list(self):
-        md = """
-- Item 1
-- Item 2
-- Item 3
-"""
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(html, "<div><ul><li>Item 1</li><li>Item 2</li><li>Item 3</li></ul></div>")
+        self.assertEqual(self.html["unordered_list"], HTML_CASES["unordered_list"][1])
 
     def test_markdown_ordered_list(self):
-        md = """
-1. Item 1
-2. Item 2
-3. Item 3
-"""
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(html, "<div><ol><li>Item 1</li><li>Item 2</li><li>Item 3</li></ol></div>")
+        self.assertEqual(self.html["ordered_list"], HTML_CASES["ordered_list"][1])
+
+    def test_codeblock_with_indented_blank_line(self):
+        self.assertEqual(self.html["codeblock_indented_blank_line"], HTML_CASES["codeblock_indented_blank_line"][1])
 
     def test_markdown_quote(self):
-        md = """> This is a quote
-> with multiple lines"""
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        self.assertEqual(html, "<div><blockquote>This is a quote with multiple lines</blockquote></div>")
+        self.assertEqual(self.html["quote"], HTML_CASES["quote"][1])
+
+    def test_repeated_inline_text_renders_the_same_every_time(self):
+        md = "Some **bold** text\n\n- Some **bold** text"
+        expected = "<div><p>Some <b>bold</b> text</p><ul><li>Some <b>bold</b> text</li></ul></div>"
+        self.assertEqual(markdown_to_html_node(md).to_html(), expected)
+        self.assertEqual(markdown_to_html_node(md).to_html(), expected)
+
+
+class TestBlockConverters(unittest.TestCase):
+    def test_block_to_heading(self):
+        self.assertEqual(block_to_heading("### A _b_").to_html(), "<h3>A <i>b</i></h3>")
+
+    def test_block_to_heading_of_other_block(self):
+        self.assertEqual(block_to_heading("####### Heading 7").to_html(), "<h1></h1>")
+
+    def test_block_to_quote(self):
+        self.assertEqual(block_to_quote("> a\n>b").to_html(), "<blockquote>a b</blockquote>")
+
+    def test_block_to_quote_of_other_block(self):
+        self.assertEqual(block_to_quote("> a\nb").to_html(), "<blockquote>a</blockquote>")
+
+    def test_block_to_ul(self):
+        self.assertEqual(block_to_ul("- a\n- **b**").to_html(), "<ul><li>a</li><li><b>b</b></li></ul>")
+
+    def test_block_to_ul_of_other_block(self):
+        self.assertEqual(block_to_ul("- a\n-b").to_html(), "<ul><li>a</li></ul>")
+
+    def test_block_to_ol(self):
+        self.assertEqual(block_to_ol("1. a\n2. b").to_html(), "<ol><li>a</li><li>b</li></ol>")
+
+    def test_block_to_ol_of_other_block(self):
+        self.assertEqual(block_to_ol("1. a\n2.b").to_html(), "<ol><li>a</li></ol>")
+
+
+class TestClassifyBlock(unittest.TestCase):
+    def test_heading_parts(self):
+        block = "### Heading 3"
+        self.assertEqual(classify_block(block), (BlockType.HEADING, (3, "Heading 3")))
+
+    def test_quote_parts(self):
+        block = "> This is a\n>multiline quote."
+        self.assertEqual(classify_block(block), (BlockType.QUOTE, ["This is a", "multiline quote."]))
+
+    def test_unordered_list_parts(self):
+        block = "- Item 1\n- Item 2"
+        self.assertEqual(classify_block(block), (BlockType.UNORDERED_LIST, ["Item 1", "Item 2"]))
+
+    def test_ordered_list_parts(self):
+        block = "1. Item 1\n2. Item 2. Done"
+        self.assertEqual(classify_block(block), (BlockType.ORDERED_LIST, ["Item 1", "Item 2. Done"]))
+
+    def test_code_block_has_no_parts(self):
+        block = "```\nCode block\n```"
+        self.assertEqual(classify_block(block), (BlockType.CODE, None))
+
+    def test_paragraph_has_no_parts(self):
+        block = "####### Heading 7"
+        self.assertEqual(classify_block(block), (BlockType.PARAGRAPH, None))
 
 
 if __name__ == "__main__":
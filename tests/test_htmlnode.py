@@ -4,6 +4,10 @@ from htmlnode import HTMLNode
 
 
 class TestHTMLNode(unittest.TestCase):
+    def setUp(self):
+        self.children = [HTMLNode("p", "Child 1"), HTMLNode("p", "Child 2")]
+        self.props = {"class": "my-class", "id": "my-id"}
+
     def test_init_no_args(self):
         node = HTMLNode()
         self.assertIsNone(node.tag)
@@ -12,9 +16,7 @@ class TestHTMLNode(unittest.TestCase):
         self.assertIsNone(node.props)
 
     def test_init_with_args(self):
-        children = [HTMLNode("p", "Child 1"), HTMLNode("p", "Child 2")]
-        props = {"class": "my-class", "id": "my-id"}
-        node = HTMLNode("div", "Some text", children, props)
+        node = HTMLNode("div", "Some text", self.children, self.props)
         self.assertEqual(node.tag, "div")
         self.assertEqual(node.value, "Some text")
         self.assertEqual(len(node.children), 2)
@@ -22,30 +24,28 @@ class TestHTMLNode(unittest.TestCase):
         self.assertEqual(node.children[0].value, "Child 1")
         self.assertEqual(node.children[1].tag, "p")
         self.assertEqual(node.children[1].value, "Child 2")
-        self.assertEqual(node.props, props)
-
-    def test_repr_no_args(self):
-        node = HTMLNode()
-        self.assertEqual(repr(node), "HTMLNode(None, None, 0 child nodes, None)")
-
-    def test_repr_with_args(self):
-        children = [HTMLNode("p", "Child 1"), HTMLNode("p", "Child 2")]
-        props = {"class": "my-class", "id": "my-id"}
-        node = HTMLNode("div", "Some text", children, props)
-        self.assertEqual(
-            repr(node),
-            "HTMLNode(div, Some text, 2 child nodes, {'class': 'my-class', 'id': 'my-id'})",
-        )
-
-    def test_props_to_html_no_props(self):
-        node = HTMLNode()
-        self.assertEqual(node.props_to_html(), "")
-
-    def test_props_to_html_with_props(self):
-        props = {"class": "my-class", "id": "my-id", "data-value": "123"}
-        node = HTMLNode(props=props)
-        expected = ' class="my-class" id="my-id" data-value="123"'
-        self.assertEqual(node.props_to_html(), expected)
+        self.assertEqual(node.props, self.props)
+
+    def test_repr_and_props_to_html(self):
+        # (constructor args, expected repr, expected props_to_html)
+        cases = [
+            ((), "HTMLNode(None, None, 0 child nodes, None)", ""),
+            (
+                ("div", "Some text", self.children, self.props),
+                "HTMLNode(div, Some text, 2 child nodes, {'class': 'my-class', 'id': 'my-id'})",
+                ' class="my-class" id="my-id"',
+            ),
+            (
+                (None, None, None, {"class": "my-class", "id": "my-id", "data-value": "123"}),
+                "HTMLNode(None, None, 0 child nodes, {'class': 'my-class', 'id': 'my-id', 'data-value': '123'})",
+                ' class="my-class" id="my-id" data-value="123"',
+            ),
+        ]
+        for args, expected_repr, expected_props in cases:
+            with self.subTest(args=args):
+                node = HTMLNode(*args)
+                self.assertEqual(repr(node), expected_repr)
+                self.assertEqual(node.props_to_html(), expected_props)
 
     def test_to_html_not_implemented(self):
         node = HTMLNode()
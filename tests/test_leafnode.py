@@ -42,6 +42,17 @@ class TestLeafNode(unittest.TestCase):
         node = LeafNode("Hello", "span", props)
         self.assertEqual(node.to_html(), '<span class="my-class" id="my-id" data-value="123">Hello</span>')
 
+    def test_write_html_appends_fragments(self):
+        out = ["<div>"]
+        LeafNode("Hello", "a", {"href": "/"}).write_html(out)
+        LeafNode(" world", None).write_html(out)
+        self.assertEqual("".join(out), '<div><a href="/">Hello</a> world')
+
+    def test_write_html_no_value(self):
+        node = LeafNode(None, "p")
+        with self.assertRaises(ValueError):
+            node.write_html([])
+
     def test_repr(self):
         node = LeafNode("Hello", "p")
         self.assertEqual(repr(node), "LeafNode(p, Hello, None)")
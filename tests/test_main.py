@@ -1,7 +1,229 @@
+import os
+import socket
+import socketserver
+import tempfile
+import threading
 import unittest
+from pathlib import Path
+from unittest import mock
 
+import main
+from main import (
+    BuildRequestHandler,
+    build,
+    copy_and_convert_pages,
+    copy_tree,
+    generate_page,
+    rebase_links,
+    split_template,
+)
 
-class TestMain(unittest.TestCase): ...
+
+class TestMain(unittest.TestCase):
+    def test_copy_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "static"
+            dest = Path(tmp) / "public"
+            (src / "images" / "nested").mkdir(parents=True)
+            (src / "index.css").write_text("body {}")
+            (src / "images" / "a.png").write_bytes(b"\x89PNG")
+            (src / "images" / "nested" / "b.txt").write_text("b")
+            dest.mkdir()
+
+            copy_tree(src, dest)
+
+            self.assertEqual((dest / "index.css").read_text(), "body {}")
+            self.assertEqual((dest / "images" / "a.png").read_bytes(), b"\x89PNG")
+            self.assertEqual((dest / "images" / "nested" / "b.txt").read_text(), "b")
+
+    def test_copy_tree_missing_source(self):
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(ValueError):
+            copy_tree(Path(tmp) / "missing", Path(tmp) / "public")
+
+    def test_copy_tree_requires_paths(self):
+        with self.assertRaises(TypeError):
+            copy_tree("static", "public")
+
+    def test_copy_and_convert_pages(self):
+        self._check_copy_and_convert_pages()
+
+    def test_copy_and_convert_pages_in_parallel(self):
+        with mock.patch.object(main, "PAGE_WORKERS", 2), mock.patch.object(main, "PARALLEL_PAGE_THRESHOLD", 1):
+            self._check_copy_and_convert_pages()
+
+    def _check_copy_and_convert_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            content = Path(tmp) / "content"
+            dest = Path(tmp) / "public"
+            template = Path(tmp) / "template.html"
+            (content / "blog" / "post").mkdir(parents=True)
+            (content / "index.md").write_text("# Home\n\nSee [the post](/blog/post)")
+            (content / "blog" / "post" / "index.md").write_text("# Post\n\nSome **bold** text")
+            (content / "notes.txt").write_text("not markdown")
+            template.write_text("<title>{{ Title }}</title><main>{{ Content }}</main>")
+
+            copy_and_convert_pages(content, template, dest, "/site/")
+
+            self.assertEqual(
+                (dest / "index.html").read_text(),
+                '<title>Home</title><main><div><h1>Home</h1><p>See <a href="/site/blog/post">the post</a></p></div></main>',
+            )
+            self.assertEqual(
+                (dest / "blog" / "post" / "index.html").read_text(),
+                "<title>Post</title><main><div><h1>Post</h1><p>Some <b>bold</b> text</p></div></main>",
+            )
+            self.assertFalse((dest / "notes.txt").exists())
+
+    def test_split_template(self):
+        template = '<link href="/index.css"><title>{{ Title }}</title><img src="/a.png">{{ Content }}</body>'
+        self.assertEqual(
+            split_template(template, "/site/"),
+            (
+                [b'<link href="/site/index.css"><title>', b'</title><img src="/site/a.png">', b"</body>"],
+                ["Title", "Content"],
+            ),
+        )
+
+    def test_split_template_repeated_placeholders(self):
+        template = "<title>{{ Title }}</title><h1>{{ Title }}</h1>{{ Content }}"
+        self.assertEqual(
+            split_template(template, "/"),
+            ([b"<title>", b"</title><h1>", b"</h1>", b""], ["Title", "Title", "Content"]),
+        )
+
+    def test_split_template_placeholders_in_any_order(self):
+        self.assertEqual(
+            split_template("{{ Content }}<title>{{ Title }}</title>", "/"),
+            ([b"", b"<title>", b"</title>"], ["Content", "Title"]),
+        )
+
+    def test_split_template_without_placeholders(self):
+        self.assertEqual(split_template("<p>static</p>", "/"), ([b"<p>static</p>"], []))
+
+    def test_generate_page_fills_every_placeholder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            page = Path(tmp) / "index.md"
+            template = Path(tmp) / "template.html"
+            dest = Path(tmp) / "public" / "index.html"
+            page.write_text("# Home\n\nHello")
+            template.write_text("<title>{{ Title }}</title><main>{{ Content }}</main><h1>{{ Title }}</h1>")
+
+            generate_page(page, template, dest, "/")
+
+            self.assertEqual(
+                dest.read_text(),
+                "<title>Home</title><main><div><h1>Home</h1><p>Hello</p></div></main><h1>Home</h1>",
+            )
+
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "static" / "images").mkdir(parents=True)
+            (root / "static" / "images" / "logo.png").write_bytes(b"png")
+            (root / "content" / "blog").mkdir(parents=True)
+            (root / "content" / "blog" / "index.md").write_text("# Blog\n\n[Home](/)")
+            (root / "templates").mkdir()
+            (root / "templates" / "template.html").write_text("<title>{{ Title }}</title>{{ Content }}")
+            (root / "docs").mkdir()
+            (root / "docs" / "stale.html").write_text("old")
+            cwd = os.getcwd()
+            os.chdir(root)
+            self.addCleanup(os.chdir, cwd)
+
+            build("/site/")
+
+            self.assertFalse((root / "docs" / "stale.html").exists())
+            self.assertEqual((root / "docs" / "images" / "logo.png").read_bytes(), b"png")
+            self.assertEqual(
+                (root / "docs" / "blog" / "index.html").read_text(),
+                '<title>Blog</title><div><h1>Blog</h1><p><a href="/site/">Home</a></p></div>',
+            )
+
+    def _request_build(self, request: bytes) -> bytes:
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = str(Path(tmp) / "build.sock")
+            with socketserver.UnixStreamServer(socket_path, BuildRequestHandler) as server:
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                        client.connect(socket_path)
+                        client.sendall(request)
+                        return client.makefile("rb").readline()
+                finally:
+                    server.shutdown()
+                    thread.join()
+
+    def test_build_request_handler(self):
+        # (request line, expected basepath)
+        cases = [(b"/static-site-gen/\n", "/static-site-gen/"), (b"\n", "/")]
+        for request, basepath in cases:
+            with self.subTest(request=request), mock.patch.object(main, "build") as build_mock:
+                self.assertEqual(self._request_build(request), b"ok\n")
+                build_mock.assert_called_once_with(basepath)
+
+    def test_build_request_handler_reports_errors(self):
+        with mock.patch.object(main, "build", side_effect=ValueError("bad page")):
+            self.assertEqual(self._request_build(b"/\n"), b"error: bad page\n")
+
+    def test_build_request_handler_reports_undecodable_request(self):
+        with mock.patch.object(main, "build") as build_mock:
+            self.assertTrue(self._request_build(b"\xff\n").startswith(b"error: 'utf-8' codec can't decode"))
+            build_mock.assert_not_called()
+
+    def test_serve_replaces_stale_socket_and_cleans_up(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = Path(tmp) / "build.sock"
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+                stale.bind(str(socket_path))
+            self.assertTrue(socket_path.is_socket())
+            listening = []
+
+            def serve_forever(server):
+                listening.append(socket_path.is_socket())
+                raise KeyboardInterrupt
+
+            with (
+                mock.patch.object(socketserver.UnixStreamServer, "serve_forever", serve_forever),
+                mock.patch("builtins.print"),
+                self.assertRaises(KeyboardInterrupt),
+            ):
+                main.serve(socket_path)
+
+            self.assertEqual(listening, [True])
+            self.assertFalse(socket_path.exists())
+
+    def test_serve_refuses_regular_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "notes.txt"
+            path.write_text("keep me")
+
+            with (
+                mock.patch.object(socketserver.UnixStreamServer, "serve_forever") as serve_forever,
+                self.assertRaises(SystemExit) as cm,
+            ):
+                main.serve(path)
+
+            self.assertEqual(cm.exception.code, f"Cannot serve on {path}: the path exists and is not a socket.")
+            serve_forever.assert_not_called()
+            self.assertEqual(path.read_text(), "keep me")
+
+    def test_main_rejects_serve_without_socket_path(self):
+        with (
+            mock.patch.object(main.sys, "argv", ["main.py", "serve"]),
+            mock.patch.object(main, "build") as build_mock,
+            self.assertRaises(SystemExit) as cm,
+        ):
+            main.main()
+        self.assertEqual(cm.exception.code, "Usage: python main.py serve <socket path>")
+        build_mock.assert_not_called()
+
+    def test_rebase_links(self):
+        html = '<a href="/blog">Blog</a><img src="/images/tom.png"><a href="https://example.com">x</a>'
+        self.assertEqual(
+            rebase_links(html, "/site/"),
+            '<a href="/site/blog">Blog</a><img src="/site/images/tom.png"><a href="https://example.com">x</a>',
+        )
 
 
 if __name__ == "__main__":
@@ -69,6 +69,27 @@ class TestParentNode(unittest.TestCase):
         expected_html = "<div><section><p>Grandchild</p></section></div>"
         self.assertEqual(parent.to_html(), expected_html)
 
+    def test_parent_node_write_html_appends_to_buffer(self):
+        child = ParentNode("section", [LeafNode("Grandchild", "p")])
+        parent = ParentNode("div", [child, LeafNode("Text", None)])
+        out = ["<body>"]
+        parent.write_html(out)
+
+        self.assertEqual(out[0], "<body>")
+        self.assertEqual("".join(out), "<body><div><section><p>Grandchild</p></section>Text</div>")
+
+    def test_parent_node_to_html_deeply_nested(self):
+        node = LeafNode("deep", "b")
+        for _ in range(5000):
+            node = ParentNode("span", [node])
+        self.assertEqual(node.to_html(), "<span>" * 5000 + "<b>deep</b>" + "</span>" * 5000)
+
+    def test_parent_node_to_html_nested_child_no_tag(self):
+        parent = ParentNode("div", [LeafNode("ok", "p"), ParentNode(None, [LeafNode("x", "b")])])
+        with self.assertRaises(ValueError) as context:
+            parent.to_html()
+        self.assertEqual(str(context.exception), "Parent nodes must have a tag.")
+
     def test_parent_node_repr(self):
         child1 = LeafNode("Child 1", "p")
         child2 = LeafNode("Child 2", "span")
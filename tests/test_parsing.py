@@ -1,6 +1,7 @@
 import unittest
 
 from parsing import (
+    UnmatchedDelimiterError,
     extract_markdown_images,
     extract_markdown_links,
     extract_title,
@@ -157,6 +158,12 @@ class TestSplitNodesDelimiter(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_delimiter_at_start_and_end_drop_empty(self):
+        """Test that drop_empty leaves out the empty text around the delimiters."""
+        nodes = [TextNode("**bold**", TextType.TEXT)]
+        result = split_nodes_delimiter(nodes, "**", TextType.BOLD, drop_empty=True)
+        self.assertEqual(result, [TextNode("bold", TextType.BOLD)])
+
     def test_multiple_delimiters_in_a_row(self):
         """Test splitting nodes with multiple delimiters in a row."""
         nodes = [TextNode("This is ****bold**** text", TextType.TEXT)]
@@ -556,6 +563,12 @@ class TestTextToTextNodes(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_delimiters_at_start_and_end(self):
+        text = "**bold**`code`"
+        result = text_to_textnodes(text)
+        expected = [TextNode("bold", TextType.BOLD), TextNode("code", TextType.CODE)]
+        self.assertEqual(result, expected)
+
     def test_empty_input(self):
         text = ""
         result = text_to_textnodes(text)
@@ -568,6 +581,14 @@ class TestTextToTextNodes(unittest.TestCase):
         # For now, test the actual output:
         self.assertEqual(result, expected)
 
+    def test_several_unmatched_delimiters_report_highest_precedence(self):
+        text = "a*b **c** d_e"
+        with self.assertRaises(UnmatchedDelimiterError) as context:
+            text_to_textnodes(text)
+        self.assertEqual(str(context.exception), "Invalid Markdown: Unmatched _ delimiter.")
+        # the error from the fused pass is not chained onto the reported one
+        self.assertIsNone(context.exception.__context__)
+
     def test_unmatched_delimiter_raises_exception(self):
         text = "This has an **unmatched delimiter"
         with self.assertRaises(Exception) as context:
@@ -590,6 +611,10 @@ class TestExtractTitle(unittest.TestCase):
         markdown = "# My Page Title\n# Another Title"
         self.assertEqual(extract_title(markdown), "My Page Title")
 
+    def test_extract_title_after_other_lines(self):
+        markdown = "Intro line\n## Subtitle\n#  My Page Title  \nSome other content"
+        self.assertEqual(extract_title(markdown), "My Page Title")
+
 
 if __name__ == "__main__":
     unittest.main()